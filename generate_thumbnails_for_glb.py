@@ -1,68 +1,163 @@
 import os
 import argparse
 import sys
-import pyvista as pv
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from PIL import Image  # Pillow is installed as a dependency of PyVista
 
 
-def generate_thumbnail(glb_path, output_path, resolution, overwrite=False):
+class ThumbnailRenderer:
     """
-    Generates a thumbnail for a single .glb file using PyVista.
+    Renders thumbnails for .glb files using a single, reused PyVista plotter.
+
+    Creating a plotter sets up a full VTK render window and OpenGL context,
+    which usually costs more than rendering a small thumbnail. The plotter is
+    therefore built once, and the props and lights each import adds are removed
+    again before the next file.
+
+    PNG encoding runs on a background thread, so the next file can be imported
+    while the previous screenshot is still being written.
 
     Args:
-        glb_path (str): The full path to the input .glb file.
-        output_path (str): The full path for the output PNG thumbnail.
-        resolution (int): The resolution (width and height) of the thumbnail.
-        overwrite (bool): If True, overwrites the thumbnail if it already exists.
+        resolution (int): The resolution (width and height) of the thumbnails.
     """
-    # Check if thumbnail already exists and if we should skip it
-    if os.path.exists(output_path) and not overwrite:
-        print(
-            f"INFO: Thumbnail already exists for {os.path.basename(glb_path)}. Skipping."
-        )
-        return
 
-    print(
-        f"Processing: {os.path.basename(glb_path)} -> {os.path.basename(output_path)}"
-    )
+    def __init__(self, resolution):
+        # Imported here so that each worker process initializes its own VTK/OpenGL
+        # context (PyVista plotters are not safe to share across processes).
+        import pyvista as pv
 
-    try:
         # Set up the plotter for off-screen rendering
-        plotter = pv.Plotter(off_screen=True, window_size=[resolution, resolution])
-        # plotter = pv.Plotter(window_size=[resolution, resolution])  # DEBUG
-
-        # Directly import GLTF/GLB
-        plotter.import_gltf(glb_path)
-
-        # Set the camera to an isometric view for a good default angle
-        # Option 1
-        plotter.camera.up = (0, 1, 0)  # NOTE: doesn't really work with isometric...
-        # plotter.reset_camera(). # NOTE: didn't help
-        # plotter.view_isometric()
-
-        # Option 2
-        plotter.view_vector(vector=[1, 1, 1], viewup=[0, 1, 0])
+        self.plotter = pv.Plotter(off_screen=True, window_size=[resolution, resolution])
+        # self.plotter = pv.Plotter(window_size=[resolution, resolution])  # DEBUG
 
         # Optional: add XYZ axes annotation gizmo
-        plotter.add_axes()
+        # (a widget in its own renderer, so it survives the per-file cleanup)
+        self.plotter.add_axes()
 
         # # Optional: Use parallel projection for a clearer, more technical look
-        # plotter.enable_parallel_projection()
+        # self.plotter.enable_parallel_projection()
+
+        # A single writer thread keeps at most one screenshot in flight
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+
+    def render(self, glb_path, output_path):
+        """
+        Generates a thumbnail for a single .glb file.
 
-        # Take a screenshot and save it
-        # plotter.show()  # DEBUG
-        plotter.screenshot(output_path, transparent_background=True)
+        Existing thumbnails are filtered out by the caller, so this always renders.
 
-        # Clean up and close the plotter to free memory
-        plotter.close()
+        Args:
+            glb_path (str): The full path to the input .glb file.
+            output_path (str): The full path for the output PNG thumbnail.
+        """
+        plotter = self.plotter
+        renderer = plotter.renderer
 
-        print(f"SUCCESS: Created thumbnail {os.path.basename(output_path)}")
+        # import_gltf runs vtkGLTFImporter against the render window, and the
+        # props and lights it creates are not tracked by PyVista, so
+        # clear_actors() alone would leave every earlier model in the scene.
+        # Remember what the renderer holds now and remove anything added later.
+        props_before = set(_collection_items(renderer.GetViewProps()))
+        lights_before = set(_collection_items(renderer.GetLights()))
 
-    except Exception as e:
         print(
-            f"ERROR: Could not process {os.path.basename(glb_path)}. Reason: {e}",
-            file=sys.stderr,
+            f"Processing: {os.path.basename(glb_path)} -> {os.path.basename(output_path)}"
         )
 
+        try:
+            # Directly import GLTF/GLB
+            plotter.import_gltf(glb_path)
+
+            # Set the camera to an isometric view for a good default angle
+            # Option 1
+            plotter.camera.up = (0, 1, 0)  # NOTE: doesn't really work with isometric...
+            # plotter.reset_camera(). # NOTE: didn't help
+            # plotter.view_isometric()
+
+            # Option 2
+            plotter.view_vector(vector=[1, 1, 1], viewup=[0, 1, 0])
+
+            # Take a screenshot (a cheap buffer copy) and save it in the background
+            # plotter.show()  # DEBUG
+            img = plotter.screenshot(
+                None, transparent_background=True, return_img=True
+            )
+            self._wait_pending()
+            self._pending = self._writer.submit(
+                self._save, img, glb_path, output_path
+            )
+
+        except Exception as e:
+            print(
+                f"ERROR: Could not process {os.path.basename(glb_path)}. Reason: {e}",
+                file=sys.stderr,
+            )
+
+        finally:
+            # Remove the imported model so the next file starts from an empty scene
+            plotter.clear_actors()
+            for prop in _collection_items(renderer.GetViewProps()):
+                if prop not in props_before:
+                    renderer.RemoveViewProp(prop)
+            for light in _collection_items(renderer.GetLights()):
+                if light not in lights_before:
+                    renderer.RemoveLight(light)
+
+    @staticmethod
+    def _save(img, glb_path, output_path):
+        """Encodes a screenshot array to PNG. Runs on the writer thread."""
+        try:
+            Image.fromarray(img).save(output_path)
+            print(f"SUCCESS: Created thumbnail {os.path.basename(output_path)}")
+        except Exception as e:
+            print(
+                f"ERROR: Could not save {os.path.basename(glb_path)}. Reason: {e}",
+                file=sys.stderr,
+            )
+
+    def _wait_pending(self):
+        """Blocks until the previously submitted screenshot has been written."""
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def close(self):
+        """Drains pending writes, then closes the plotter and frees its render window."""
+        self._wait_pending()
+        self._writer.shutdown()
+        self.plotter.close()
+
+
+def _collection_items(collection):
+    """Returns the items of a vtkCollection as a list."""
+    return [
+        collection.GetItemAsObject(i) for i in range(collection.GetNumberOfItems())
+    ]
+
+
+# The renderer owned by the current worker process (see init_worker)
+_renderer = None
+
+
+def init_worker(resolution):
+    """
+    ProcessPoolExecutor initializer: builds one ThumbnailRenderer per worker.
+    """
+    global _renderer
+    _renderer = ThumbnailRenderer(resolution)
+    # Pool workers leave via os._exit(), which skips atexit handlers; a
+    # multiprocessing finalizer is still run on worker shutdown.
+    multiprocessing.util.Finalize(_renderer, _renderer.close, exitpriority=10)
+
+
+def generate_thumbnail_worker(task):
+    """
+    Unpacks a (glb_path, output_path) tuple for use with ProcessPoolExecutor.map.
+    """
+    _renderer.render(*task)
+
 
 def main():
     """
@@ -96,8 +191,21 @@ def main():
         help="Force overwrite of existing thumbnails.",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes used for rendering.\n"
+        "Lower this if rendering memory per worker becomes a problem.\n"
+        "Defaults to the number of CPUs.",
+    )
+
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     # Validate that the input directory exists
     if not os.path.isdir(args.directory):
         print(f"Error: Directory not found at '{args.directory}'", file=sys.stderr)
@@ -108,23 +216,47 @@ def main():
     print(f"  Directory:   {args.directory}")
     print(f"  Resolution:  {args.resolution}x{args.resolution}")
     print(f"  Overwrite:   {args.overwrite}")
+    print(f"  Jobs:        {args.jobs}")
     print("-" * 50)
 
-    # Recursively walk the directory
+    # Recursively walk the directory and collect the work to be done
+    tasks = []
     file_count = 0
+    skipped_count = 0
     for root, _, files in os.walk(args.directory):
+        # The directory listing is already in memory, so existing thumbnails
+        # can be looked up in a set instead of stat-ing each output path
+        png_files = {file for file in files if file.lower().endswith(".png")}
+
         for file in files:
             # Check if the file has a .glb extension
             if file.lower().endswith(".glb"):
                 file_count += 1
-                glb_path = os.path.join(root, file)
 
-                # Define the output path for the thumbnail (e.g., model.glb -> model.png)
-                output_path = os.path.splitext(glb_path)[0] + ".png"
+                # Define the output name for the thumbnail (e.g., model.glb -> model.png)
+                png_file = file[:-4] + ".png"
+
+                # Skip existing thumbnails here, so re-runs never reach a worker
+                if not args.overwrite and png_file in png_files:
+                    skipped_count += 1
+                    continue
+
+                tasks.append((os.path.join(root, file), os.path.join(root, png_file)))
+
+    if skipped_count:
+        print(f"INFO: Skipping {skipped_count} .glb file(s) with existing thumbnails.")
 
-                generate_thumbnail(
-                    glb_path, output_path, args.resolution, args.overwrite
-                )
+    # Render thumbnails concurrently, one plotter per process. Every worker sets
+    # up its own render window, so never start more workers than there are tasks.
+    # Tasks are handed out one at a time: a render takes far longer than the IPC
+    # round trip, and larger chunks would leave started workers without work.
+    if tasks:
+        with ProcessPoolExecutor(
+            max_workers=min(args.jobs, len(tasks)),
+            initializer=init_worker,
+            initargs=(args.resolution,),
+        ) as executor:
+            list(executor.map(generate_thumbnail_worker, tasks, chunksize=1))
 
     if file_count == 0:
         print("No .glb files found in the specified directory.")
@@ -2,23 +2,147 @@
 #
 # A command-line script to scale 3D models in GLB/GLTF format.
 #
-# This script uses PyVista to read a model, apply a scaling transformation,
-# and export the result to a new file.
+# By default the scale is written into the glTF scene graph: a new root node
+# carrying the scale is inserted above the existing scene roots, and the binary
+# buffers are copied through untouched. Relative buffer and image URIs (external
+# .bin files and textures) are rewritten so that they still point at the
+# original files from the output's directory; those files are not copied, and
+# embedded data: URIs are kept as they are. With --bake, the script instead uses
+# PyVista to read the model, scale every vertex, and export the result.
 #
 # Dependencies:
-#   pip install pyvista
+#   pip install pyvista  (only needed for --bake)
 #
 # How to Run:
 #   python glb_scaler.py input_model.glb output_model.glb --scale 1.0 1.0 2.0
 #
 # This example command would make the model twice as tall along the Z-axis.
 
-import pyvista as pv
 import argparse
+import json
 import os
+import struct
+from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
 
+GLB_MAGIC = b"glTF"
+GLB_HEADER = struct.Struct("<4sII")  # magic, version, total length
+GLB_CHUNK_HEADER = struct.Struct("<I4s")  # chunk length, chunk type
+GLB_CHUNK_JSON = b"JSON"
 
-def scale_glb_model(input_path, output_path, scale_factors):
+
+def read_gltf(path):
+    """
+    Reads a .glb or .gltf file.
+
+    Returns:
+        A (gltf, chunks) tuple: the parsed JSON document and, for .glb files,
+        the list of remaining (chunk_type, data) pairs (None for .gltf).
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(GLB_MAGIC):
+        return json.loads(data), None
+
+    _, version, length = GLB_HEADER.unpack_from(data, 0)
+    if version != 2:
+        raise ValueError(f"Unsupported GLB version {version}")
+
+    gltf, chunks = None, []
+    offset = GLB_HEADER.size
+    while offset < length:
+        chunk_length, chunk_type = GLB_CHUNK_HEADER.unpack_from(data, offset)
+        offset += GLB_CHUNK_HEADER.size
+        chunk = data[offset : offset + chunk_length]
+        offset += chunk_length
+        if gltf is None and chunk_type == GLB_CHUNK_JSON:
+            gltf = json.loads(chunk)
+        else:
+            # The binary buffer (and any unknown chunks) are kept as-is
+            chunks.append((chunk_type, chunk))
+
+    if gltf is None:
+        raise ValueError("GLB file has no JSON chunk")
+    return gltf, chunks
+
+
+def write_gltf(path, gltf, chunks):
+    """Writes a document produced by read_gltf, reusing the original chunks."""
+    json_bytes = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+
+    if chunks is None:
+        with open(path, "wb") as f:
+            f.write(json_bytes)
+        return
+
+    # Chunks must be 4-byte aligned; the JSON chunk is padded with spaces
+    json_bytes += b" " * (-len(json_bytes) % 4)
+    body = [(GLB_CHUNK_JSON, json_bytes)] + chunks
+    length = GLB_HEADER.size + sum(GLB_CHUNK_HEADER.size + len(c) for _, c in body)
+
+    with open(path, "wb") as f:
+        f.write(GLB_HEADER.pack(GLB_MAGIC, 2, length))
+        for chunk_type, chunk in body:
+            f.write(GLB_CHUNK_HEADER.pack(len(chunk), chunk_type))
+            f.write(chunk)
+
+
+def rebase_uris(gltf, input_dir, output_dir):
+    """
+    Rewrites relative buffer and image URIs so they resolve from output_dir.
+
+    URIs with a scheme (data:, http:, file:, ...) are left unchanged.
+    """
+    if os.path.realpath(input_dir) == os.path.realpath(output_dir):
+        return
+
+    for key in ("buffers", "images"):
+        for item in gltf.get(key, []):
+            uri = item.get("uri")
+            if uri is None or urlsplit(uri).scheme:
+                continue
+
+            target = os.path.join(input_dir, unquote(uri))
+            try:
+                rel = os.path.relpath(target, output_dir)
+            except ValueError:
+                # No relative path exists (e.g. another drive on Windows)
+                item["uri"] = Path(os.path.abspath(target)).as_uri()
+                continue
+            item["uri"] = quote(rel.replace(os.sep, "/"))
+
+
+def add_root_scale(gltf, scale_factors):
+    """
+    Scales every scene by parenting its root nodes under a new scaled node.
+
+    Composing the scale above the existing roots keeps their own transforms
+    (TRS or matrix) intact, so no vertex data has to be touched.
+    """
+    scenes = gltf.get("scenes")
+    if not scenes:
+        raise ValueError("The model does not define any scenes")
+
+    seen_roots = set()
+    nodes = gltf.setdefault("nodes", [])
+    for scene in scenes:
+        roots = scene.get("nodes", [])
+        if not roots:
+            # Nothing to scale, and glTF requires "children" to be non-empty
+            continue
+        if seen_roots.intersection(roots):
+            # A node may only have one parent, so shared roots cannot be wrapped
+            raise ValueError("Scenes share root nodes; use --bake instead")
+        seen_roots.update(roots)
+
+        nodes.append(
+            {"name": "glb_scaler_root", "scale": list(scale_factors), "children": roots}
+        )
+        scene["nodes"] = [len(nodes) - 1]
+
+
+def scale_glb_model(input_path, output_path, scale_factors, bake=False):
     """
     Loads a GLB model, scales it, and saves it to a new file.
 
@@ -26,6 +150,8 @@ def scale_glb_model(input_path, output_path, scale_factors):
         input_path (str): The file path for the input GLB model.
         output_path (str): The file path for the scaled output GLB model.
         scale_factors (list[float]): A list of three floats for X, Y, Z scaling.
+        bake (bool): If True, scale the vertices with PyVista instead of
+            adding a scaled root node to the scene graph.
     """
     # --- 1. Input Validation ---
     if not os.path.exists(input_path):
@@ -36,9 +162,66 @@ def scale_glb_model(input_path, output_path, scale_factors):
         print("Error: Please provide exactly three scale factors for X, Y, and Z.")
         return
 
+    input_ext = os.path.splitext(input_path)[1].lower()
+    output_ext = os.path.splitext(output_path)[1].lower()
+    if not bake and input_ext != output_ext:
+        # Converting between .glb and .gltf requires re-encoding the buffers
+        print("Input and output formats differ; baking the scale with PyVista.")
+        bake = True
+
+    if bake:
+        bake_scale(input_path, output_path, scale_factors)
+        return
+
     print(f"Loading model from: {input_path}")
 
-    # --- 2. Read the Mesh ---
+    # --- 2. Read the glTF Document ---
+    try:
+        gltf, chunks = read_gltf(input_path)
+    except Exception as e:
+        print(f"Error: Failed to read the model file. {e}")
+        return
+
+    print("Model loaded successfully.")
+
+    # --- 3. Apply Scaling ---
+    try:
+        add_root_scale(gltf, scale_factors)
+    except ValueError as e:
+        print(f"Error: Failed to scale the model. {e}")
+        return
+    print(f"Applied scaling factors (X, Y, Z): {scale_factors}")
+
+    # Keep references to external .bin files and textures valid
+    rebase_uris(
+        gltf,
+        os.path.dirname(os.path.abspath(input_path)),
+        os.path.dirname(os.path.abspath(output_path)),
+    )
+
+    # --- 4. Export the Scaled Model ---
+    print(f"Exporting scaled model to: {output_path}")
+    try:
+        write_gltf(output_path, gltf, chunks)
+        print("Export complete!")
+    except Exception as e:
+        print(f"Error: Failed to export the model file. {e}")
+
+
+def bake_scale(input_path, output_path, scale_factors):
+    """
+    Scales the model's vertices with PyVista and exports the result.
+
+    Args:
+        input_path (str): The file path for the input GLB model.
+        output_path (str): The file path for the scaled output GLB model.
+        scale_factors (list[float]): A list of three floats for X, Y, Z scaling.
+    """
+    import pyvista as pv
+
+    print(f"Loading model from: {input_path}")
+
+    # --- 1. Read the Mesh ---
     # PyVista's read function automatically handles GLB/GLTF files.
     try:
         mesh = pv.read(input_path)
@@ -49,13 +232,12 @@ def scale_glb_model(input_path, output_path, scale_factors):
     print("Model loaded successfully.")
     print(f"Original Bounds: {mesh.bounds}")
 
-    # --- 3. Apply Scaling ---
-    # The scale() method modifies the mesh in place by default.
-    mesh.scale(scale_factors, inplace=True)
+    # --- 2. Apply Scaling ---
+    scale_points_inplace(mesh, scale_factors)
     print(f"Applied scaling factors (X, Y, Z): {scale_factors}")
     print(f"New Scaled Bounds: {mesh.bounds}")
 
-    # --- 4. Export the Scaled Mesh ---
+    # --- 3. Export the Scaled Mesh ---
     # To export to GLTF/GLB, we need to add the mesh to a Plotter scene.
     # Using off_screen=True prevents an interactive window from appearing.
     plotter = pv.Plotter(off_screen=True)
@@ -70,12 +252,49 @@ def scale_glb_model(input_path, output_path, scale_factors):
         print(f"Error: Failed to export the model file. {e}")
 
 
+def scale_points_inplace(mesh, scale_factors):
+    """
+    Scales a PyVista dataset (or every block of a MultiBlock) in place.
+
+    The points array is multiplied directly, which avoids the extra copy of
+    the vertex buffer made by VTK's transform filter. Point normals are
+    multiplied by the inverse scale and renormalized, which is only needed
+    when the scale is anisotropic.
+
+    Args:
+        mesh (pv.DataSet | pv.MultiBlock): The mesh to scale.
+        scale_factors (list[float]): A list of three floats for X, Y, Z scaling.
+    """
+    import numpy as np
+    import pyvista as pv
+
+    if isinstance(mesh, pv.MultiBlock):
+        for block in mesh:
+            if block is not None:
+                scale_points_inplace(block, scale_factors)
+        return
+
+    if mesh.n_points == 0:
+        return
+
+    points = mesh.points
+    points *= np.asarray(scale_factors, dtype=points.dtype)
+    mesh.GetPoints().Modified()  # In-place numpy ops bypass VTK's change tracking
+
+    normals = mesh.point_data.active_normals
+    if normals is not None and len(set(scale_factors)) > 1:
+        normals /= np.asarray(scale_factors, dtype=normals.dtype)
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        np.divide(normals, lengths, out=normals, where=lengths > 0)
+        mesh.point_data.GetNormals().Modified()
+
+
 def main():
     """
     Parses command-line arguments and runs the scaling function.
     """
     parser = argparse.ArgumentParser(
-        description="A CLI tool to scale GLB/GLTF 3D models using PyVista.",
+        description="A CLI tool to scale GLB/GLTF 3D models.",
         formatter_class=argparse.RawTextHelpFormatter,  # For better help text formatting
     )
 
@@ -94,9 +313,16 @@ def main():
         help="Scaling factors for the X, Y, and Z axes (e.g., 1.0 1.0 2.0).",
     )
 
+    parser.add_argument(
+        "--bake",
+        action="store_true",
+        help="Apply the scale to every vertex using PyVista, instead of\n"
+        "adding a scaled root node to the glTF scene graph.",
+    )
+
     args = parser.parse_args()
 
-    scale_glb_model(args.input_file, args.output_file, args.scale)
+    scale_glb_model(args.input_file, args.output_file, args.scale, bake=args.bake)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,19 @@
 #!/usr/bin/env python3
 
 import argparse
+import re
 import sys
 import os
 
+# Matches an equals sign followed by a Windows-style ('\r\n') or Unix-style
+# ('\n') newline, so both are handled in a single pass over the content.
+# A '\n' directly after a removed '\r\n' is removed as well, as it was when
+# the two newline styles were replaced one after the other ('=\r\n\n' -> '=').
+NEWLINE_AFTER_EQUALS = re.compile(r'=(?:\r\n\n?|\n)')
+
+# Number of characters read per iteration when streaming a file.
+CHUNK_SIZE = 1 << 20
+
 def remove_newlines_after_equals(content: str) -> str:
     """
     Removes newline characters that immediately follow an equals sign.
@@ -17,11 +27,76 @@ def remove_newlines_after_equals(content: str) -> str:
     Returns:
         The processed string with the target newlines removed.
     """
-    # It's important to replace the Windows-style newline ('\r\n') first.
-    # If '\n' were replaced first, you might be left with a stray '\r'.
-    processed_content = content.replace('=\r\n', '=')
-    processed_content = processed_content.replace('=\n', '=')
-    return processed_content
+    # The '\r\n' alternative is tried first, so no stray '\r' is left behind.
+    return NEWLINE_AFTER_EQUALS.sub('=', content)
+
+def stream_remove_newlines_after_equals(fin, fout, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Streams `fin` to `fout`, removing newlines that follow an equals sign.
+
+    Only one chunk is held in memory at a time. A trailing '=', '=\r' or
+    '=\r\n' is carried over to the next chunk, since those are the only places
+    where a target sequence can be split across a chunk boundary.
+
+    Args:
+        fin: A readable text file object.
+        fout: A writable text file object.
+        chunk_size: The number of characters to read per iteration.
+    """
+    carry = ''
+    for chunk in iter(lambda: fin.read(chunk_size), ''):
+        text = carry + chunk
+        if text.endswith('='):
+            hold = 1
+        elif text.endswith('=\r'):
+            hold = 2
+        elif text.endswith('=\r\n'):
+            hold = 3
+        else:
+            hold = 0
+        # The carry is taken from the raw input, so a '=' left behind by a
+        # substitution is never matched a second time.
+        carry = text[len(text) - hold:]
+        fout.write(remove_newlines_after_equals(text[:len(text) - hold]))
+    fout.write(remove_newlines_after_equals(carry))
+
+def stream_file(input_path: str, output_path: str | None) -> None:
+    """
+    Streams the input file through the filter to the output file or stdout.
+
+    Exits the script with an error message if processing fails.
+    """
+    try:
+        with open(input_path, 'r', encoding='utf-8') as fin:
+            if output_path:
+                with open(output_path, 'w', encoding='utf-8') as fout:
+                    stream_remove_newlines_after_equals(fin, fout)
+            else:
+                stream_remove_newlines_after_equals(fin, sys.stdout)
+    except Exception as e:
+        print(f"Error: Could not process file '{input_path}'. Reason: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if output_path:
+        print(f"Success! Processed content has been saved to '{output_path}'")
+
+def write_output(modified_content: str, output_path: str | None) -> None:
+    """
+    Writes already-processed content to the output file or stdout.
+    """
+    if output_path:
+        # Write the modified content to the specified output file.
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(modified_content)
+            print(f"Success! Processed content has been saved to '{output_path}'")
+        except Exception as e:
+            print(f"Error: Could not write to file '{output_path}'. Reason: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        # If no output file is specified, print the result to standard output.
+        # This allows for piping to other commands.
+        sys.stdout.write(modified_content)
 
 def main():
     """
@@ -72,16 +147,30 @@ Examples of how to use the script:
 
     args = parser.parse_args()
 
-    # --- Read Input Content ---
+    # --- Read, Process, and Write the Content ---
     input_content = ""
     if args.string:
         # Use the string provided in the command-line arguments.
+        # Command-line strings are small, so they are processed in memory.
         input_content = args.string
     elif args.file:
         # Check if the file exists before trying to open it.
         if not os.path.exists(args.file):
             print(f"Error: Input file not found at '{args.file}'", file=sys.stderr)
             sys.exit(1)
+
+        # Rewriting a file in place cannot be streamed, since opening the
+        # output would truncate the input before it has been read.
+        in_place = (
+            args.output is not None
+            and os.path.exists(args.output)
+            and os.path.samefile(args.file, args.output)
+        )
+
+        if not in_place:
+            stream_file(args.file, args.output)
+            return
+
         # Read the content from the specified file.
         try:
             with open(args.file, 'r', encoding='utf-8') as f:
@@ -90,23 +179,7 @@ Examples of how to use the script:
             print(f"Error: Could not read file '{args.file}'. Reason: {e}", file=sys.stderr)
             sys.exit(1)
 
-    # --- Process the Content ---
-    modified_content = remove_newlines_after_equals(input_content)
-
-    # --- Write Output ---
-    if args.output:
-        # Write the modified content to the specified output file.
-        try:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-            print(f"Success! Processed content has been saved to '{args.output}'")
-        except Exception as e:
-            print(f"Error: Could not write to file '{args.output}'. Reason: {e}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        # If no output file is specified, print the result to standard output.
-        # This allows for piping to other commands.
-        sys.stdout.write(modified_content)
+    write_output(remove_newlines_after_equals(input_content), args.output)
 
 if __name__ == "__main__":
     # This standard Python construct ensures the main() function is called
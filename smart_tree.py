@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 import os
 import stat
+import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 from rich.text import Text
@@ -42,43 +44,131 @@ EXECUTABLE_EXTENSIONS = {
 }
 # --- End Configuration ---
 
+# Style per file suffix, built once so the per-entry check is a single lookup.
+# Compressed files take precedence over executable/source extensions.
+_EXT_STYLE = {ext: "bold green" for ext in EXECUTABLE_EXTENSIONS}
+_EXT_STYLE.update({ext: "bold red" for ext in COMPRESSED_EXTENSIONS})
+
+# Executable permission bits are only meaningful on non-Windows systems
+_IS_POSIX = os.name != "nt"
+
 console = Console()
 
 
-def get_file_style(path: Path) -> str:
-    """Determines the rich style for a given file path."""
-    if path.is_dir():
+def get_file_style(entry: os.DirEntry) -> str:
+    """Determines the rich style for a given directory entry."""
+    # Style follows symlinks, so a link is shown like its target. The type of
+    # anything else still comes from the directory read, without a syscall.
+    if entry.is_dir():
         return "bold blue"
 
-    # Check for compressed files by extension
-    if path.suffix.lower() in COMPRESSED_EXTENSIONS:
-        return "bold red"
+    # Take the suffix straight from the cached name (no PurePath, no syscall).
+    # Like Path.suffix, a name without a dot, or only a leading one, has none.
+    name = entry.name
+    dot = name.rfind(".")
+    if dot > 0:
+        style = _EXT_STYLE.get(name[dot:].lower())
+        if style is not None:
+            return style
 
-    # Check for common executable/source extensions first
-    if path.suffix.lower() in EXECUTABLE_EXTENSIONS:
-        return "bold green"
-
-    # Fallback check for executable permissions (for non-Windows systems)
-    try:
-        if os.name != "nt" and (path.stat().st_mode & stat.S_IXUSR):
-            return "bold green"
-    except (OSError, PermissionError):
-        # Ignore if we can't stat the file
-        pass
+    # Fallback check for executable permissions.
+    # This is the only stat call per entry, and DirEntry caches its result.
+    if _IS_POSIX:
+        try:
+            if entry.stat().st_mode & stat.S_IXUSR:
+                return "bold green"
+        except OSError:
+            # Ignore if we can't stat the file
+            pass
 
     # Default style for regular files
     return ""
 
 
-def smart_tree(
-    directory: Path, prefix: str = "", filelimit: int | None = None, preview: int = 3
+def scan_directory(directory: str | os.PathLike) -> list[os.DirEntry]:
+    """Returns the non-hidden entries of a directory, sorted by name."""
+    # os.scandir caches the file type from the directory read, so is_dir()
+    # needs no extra stat call.
+    with os.scandir(directory) as it:
+        return sorted(
+            (e for e in it if not e.name.startswith(".")), key=lambda e: e.name
+        )
+
+
+class TreeScanner:
+    """
+    Scans directories on a thread pool ahead of the printer.
+
+    As soon as a directory has been listed, scans of its subdirectories are
+    submitted, so many reads are in flight at once. This pays off on
+    high-latency filesystems (NFS, FUSE mounts), where the walk is dominated by
+    readdir latency rather than CPU. Results are kept per path so the printer
+    can consume them in deterministic depth-first order.
+    """
+
+    def __init__(self, filelimit: int | None = None, max_workers: int = 16):
+        self.filelimit = filelimit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = {}
+
+    def submit(self, directory: str | os.PathLike):
+        """Starts scanning a directory in the background."""
+        self._futures[directory] = self._executor.submit(self._scan, directory)
+
+    def _scan(self, directory: str | os.PathLike) -> list[os.DirEntry]:
+        items = scan_directory(directory)
+        # Only prefetch subdirectories the printer will actually descend into.
+        # They are submitted before returning, so the printer always finds them.
+        if self.filelimit is None or len(items) <= self.filelimit:
+            for item in items:
+                if item.is_dir(follow_symlinks=False):
+                    self.submit(item.path)
+        return items
+
+    def result(self, directory: str | os.PathLike) -> list[os.DirEntry]:
+        """Waits for and returns the entries of a submitted directory."""
+        return self._futures.pop(directory).result()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Preformatted tree connectors, so the hot loop only concatenates strings
+BRANCH = "├── "
+LAST_BRANCH = "└── "
+PIPE_PREFIX = "│   "
+SPACE_PREFIX = "    "
+
+
+def render_tree(
+    scanner: TreeScanner,
+    directory: str | os.PathLike,
+    out: Text | list[str],
+    prefix: str = "",
+    filelimit: int | None = None,
+    preview: int = 3,
 ):
-    """Recursively prints a tree, truncating large directories and adding color."""
+    """
+    Recursively renders a scanned tree into `out`, one line per entry.
+
+    `out` is a rich Text when the tree is colored, or a list of plain strings
+    otherwise (in which case no file styles are computed). Rendering is kept
+    on a single thread so the tree layout stays deterministic.
+    """
+    color = isinstance(out, Text)
+
+    def emit(head: str, name: str, style: str):
+        if color:
+            out.append(head)
+            out.append(name, style=style)
+            out.append("\n")
+        else:
+            out.append(head + name + "\n")
+
     try:
-        # Get a sorted list of non-hidden items
-        items = sorted([p for p in directory.iterdir() if not p.name.startswith(".")])
+        items = scanner.result(directory)
     except PermissionError:
-        console.print(f"{prefix}└── [Permission Denied]", style="dim")
+        emit(prefix + LAST_BRANCH, "[Permission Denied]", "dim")
         return
 
     item_count = len(items)
@@ -86,29 +176,60 @@ def smart_tree(
     # Truncate only if filelimit is set and the count is exceeded
     if filelimit is not None and item_count > filelimit:
         # It's large: show a preview and stop.
+        head = prefix + BRANCH
         for item in items[:preview]:
-            style = get_file_style(item)
-            console.print(f"{prefix}├── ", Text(item.name, style=style))
-        console.print(
-            f"{prefix}└── ... ({item_count - preview} more items)", style="dim"
-        )
+            emit(head, item.name, get_file_style(item) if color else "")
+        emit(prefix + LAST_BRANCH, f"... ({item_count - preview} more items)", "dim")
     else:
         # It's small or no limit is set: list everything.
+        branch_head = prefix + BRANCH
+        last_head = prefix + LAST_BRANCH
         for i, item in enumerate(items):
             is_last = i == item_count - 1
-            connector = "└──" if is_last else "├──"
-            new_prefix = "    " if is_last else "│   "
 
-            style = get_file_style(item)
-            console.print(f"{prefix}{connector}", Text(item.name, style=style))
+            emit(
+                last_head if is_last else branch_head,
+                item.name,
+                get_file_style(item) if color else "",
+            )
 
-            if item.is_dir():
+            # Symlinked directories are not followed, which also avoids cycles
+            if item.is_dir(follow_symlinks=False):
                 # It's a directory, so recurse with the same settings.
-                smart_tree(
-                    item, prefix + new_prefix, filelimit=filelimit, preview=preview
+                render_tree(
+                    scanner,
+                    item.path,
+                    out,
+                    prefix + (SPACE_PREFIX if is_last else PIPE_PREFIX),
+                    filelimit=filelimit,
+                    preview=preview,
                 )
 
 
+def smart_tree(
+    directory: str | os.PathLike,
+    prefix: str = "",
+    filelimit: int | None = None,
+    preview: int = 3,
+    workers: int = 16,
+    color: bool = True,
+) -> Text | str:
+    """
+    Builds a tree, truncating large directories and adding color.
+
+    Returns a rich Text to be printed with a single console.print call, or a
+    plain string when `color` is False.
+    """
+    out = Text() if color else []
+    scanner = TreeScanner(filelimit=filelimit, max_workers=workers)
+    try:
+        scanner.submit(directory)
+        render_tree(scanner, directory, out, prefix, filelimit=filelimit, preview=preview)
+    finally:
+        scanner.shutdown()
+    return out if color else "".join(out)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="A 'smart' tree command that can truncate large directories.",
@@ -132,12 +253,36 @@ if __name__ == "__main__":
         default=3,
         help="Number of example files to show for truncated directories.\nDefault is 3.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Number of directories scanned concurrently.\nRaise this on high-latency filesystems (NFS, FUSE). Default is 16.",
+    )
     args = parser.parse_args()
 
-    start_path = Path(args.path).resolve()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
-    # Print the root directory
-    console.print(str(start_path), style="bold magenta")
+    start_path = Path(args.path).resolve()
 
-    # Start the tree traversal with the parsed arguments
-    smart_tree(start_path, filelimit=args.filelimit, preview=args.preview)
+    if sys.stdout.isatty():
+        # Print the root directory, then the whole colored tree in one render
+        console.print(str(start_path), style="bold magenta")
+        tree = smart_tree(
+            start_path,
+            filelimit=args.filelimit,
+            preview=args.preview,
+            workers=args.workers,
+        )
+        console.print(tree, end="")
+    else:
+        # Output is piped or redirected: skip Rich and write plain text
+        tree = smart_tree(
+            start_path,
+            filelimit=args.filelimit,
+            preview=args.preview,
+            workers=args.workers,
+            color=False,
+        )
+        sys.stdout.write(f"{start_path}\n{tree}")
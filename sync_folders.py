@@ -13,8 +13,11 @@ python sync_folders.py ./project-original ./project-ported --force
 """
 import argparse
 import datetime
+import errno
+import functools
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
@@ -26,19 +29,95 @@ from rich.table import Table
 console = Console()
 
 
+def _scan(root_dir: str):
+    """
+    Walks a directory tree with os.scandir and yields a
+    (relative_path, absolute_path, stat_result) tuple for each file.
+
+    Relative paths always use "/" as the separator. Like os.walk, unreadable
+    directories are skipped and symlinked directories are not descended into.
+    """
+    stack = [(root_dir, "")]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            relative_path = rel_dir + entry.name
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    stack.append((entry.path, relative_path + "/"))
+            else:
+                # DirEntry.stat() caches its result, so this is the only stat call
+                yield relative_path, entry.path, entry.stat()
+
+
 def get_file_map(root_dir: str) -> dict:
     """
     Crawls a directory tree and returns a dictionary mapping each file's
-    relative path to its absolute path and modification time.
+    relative path to its absolute path, modification time, and size.
     """
-    file_map = {}
-    for dirpath, _, filenames in os.walk(root_dir):
-        for filename in filenames:
-            absolute_path = os.path.join(dirpath, filename)
-            relative_path = os.path.relpath(absolute_path, root_dir).replace("\\", "/")
-            mtime = os.path.getmtime(absolute_path)
-            file_map[relative_path] = {"abs_path": absolute_path, "mtime": mtime}
-    return file_map
+    return {
+        relative_path: {
+            "abs_path": absolute_path,
+            "mtime": st.st_mtime,
+            "size": st.st_size,
+        }
+        for relative_path, absolute_path, st in _scan(root_dir)
+    }
+
+
+# Bytes requested per os.copy_file_range call
+COPY_RANGE_CHUNK = 1 << 30
+
+# Errors meaning copy_file_range cannot be used here, so shutil is used instead
+COPY_RANGE_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EOPNOTSUPP,
+    errno.ETXTBSY,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _device(directory: str) -> int:
+    """Returns the device ID of a directory, cached per directory."""
+    return os.stat(directory).st_dev
+
+
+def copy_file(src: str, dest: str):
+    """
+    Copies a file and its metadata, like shutil.copy2.
+
+    When both files are on the same filesystem and os.copy_file_range is
+    available (Linux), the data is copied inside the kernel, or reflinked on
+    filesystems such as btrfs and XFS, instead of passing through userspace.
+    """
+    if hasattr(os, "copy_file_range") and _device(os.path.dirname(src)) == _device(
+        os.path.dirname(dest)
+    ):
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            try:
+                copied = os.copy_file_range(
+                    fsrc.fileno(), fdst.fileno(), COPY_RANGE_CHUNK
+                )
+            except OSError as e:
+                if e.errno not in COPY_RANGE_UNSUPPORTED:
+                    raise
+                copied = None
+            while copied:
+                copied = os.copy_file_range(
+                    fsrc.fileno(), fdst.fileno(), COPY_RANGE_CHUNK
+                )
+        if copied is not None:
+            shutil.copystat(src, dest)
+            return
+
+    shutil.copy2(src, dest)
 
 
 def format_time(timestamp: float) -> str:
@@ -46,7 +125,9 @@ def format_time(timestamp: float) -> str:
     return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
 
-def compare_and_suggest_sync(dir1: str, dir2: str) -> list[tuple[str, str, str]]:
+def compare_and_suggest_sync(
+    dir1: str, dir2: str, serial_scan: bool = False
+) -> list[tuple[str, str, str]]:
     """
     Compares two directories and returns a list of suggested file sync operations.
     A report table is printed to the console.
@@ -54,6 +135,8 @@ def compare_and_suggest_sync(dir1: str, dir2: str) -> list[tuple[str, str, str]]
     Args:
         dir1 (str): The path to the first directory.
         dir2 (str): The path to the second directory.
+        serial_scan (bool): If True, scan the directories one after the other
+            instead of concurrently.
 
     Returns:
         A list of suggested operations. Each operation is a tuple
@@ -71,8 +154,16 @@ def compare_and_suggest_sync(dir1: str, dir2: str) -> list[tuple[str, str, str]]
     )
     console.print(panel)
 
-    dir1_files = get_file_map(dir1)
-    dir2_files = get_file_map(dir2)
+    if serial_scan:
+        dir1_files = get_file_map(dir1)
+        dir2_files = get_file_map(dir2)
+    else:
+        # The scans are I/O bound and release the GIL, so they overlap well
+        # when the directories live on different disks or network mounts.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(get_file_map, dir1)
+            future2 = executor.submit(get_file_map, dir2)
+            dir1_files, dir2_files = future1.result(), future2.result()
 
     dir1_rel_paths = set(dir1_files.keys())
     dir2_rel_paths = set(dir2_files.keys())
@@ -93,7 +184,7 @@ def compare_and_suggest_sync(dir1: str, dir2: str) -> list[tuple[str, str, str]]
     table.add_column("Relative Path", style="green")
     table.add_column("Reason", style="yellow")
 
-    # --- 1. Compare common files based on modification time ---
+    # --- 1. Compare common files based on modification time and size ---
     for rel_path in sorted(list(common_files)):
         file1 = dir1_files[rel_path]
         file2 = dir2_files[rel_path]
@@ -108,6 +199,21 @@ def compare_and_suggest_sync(dir1: str, dir2: str) -> list[tuple[str, str, str]]
                 reason = f"Newer in DIR 2 ({format_time(file2['mtime'])} > {format_time(file1['mtime'])})"
                 table.add_row("COPY DIR 2 -> 1", rel_path, reason)
                 suggestions.append(("COPY", file2["abs_path"], file1["abs_path"]))
+        elif file1["size"] != file2["size"]:
+            # Same mtime within tolerance but different contents, so the files
+            # cannot be identical; the newer one wins, DIR 1 on an exact tie
+            sizes = f"{file1['size']} B vs {file2['size']} B"
+            if file2["mtime"] > file1["mtime"]:
+                reason = f"Size differs, mtimes within 1 s, newer in DIR 2 ({sizes})"
+                table.add_row("COPY DIR 2 -> 1", rel_path, reason)
+                suggestions.append(("COPY", file2["abs_path"], file1["abs_path"]))
+            else:
+                if file1["mtime"] > file2["mtime"]:
+                    reason = f"Size differs, mtimes within 1 s, newer in DIR 1 ({sizes})"
+                else:
+                    reason = f"Size differs with identical mtime ({sizes})"
+                table.add_row("COPY DIR 1 -> 2", rel_path, reason)
+                suggestions.append(("COPY", file1["abs_path"], file2["abs_path"]))
 
     # --- 2. Report files that only exist in one directory ---
     for rel_path in sorted(list(only_in_dir1)):
@@ -143,22 +249,43 @@ def execute_sync(suggestions: list[tuple[str, str, str]]):
         f"\n[bold yellow]Found {len(suggestions)} operations to perform.[/bold yellow]"
     )
 
+    copies = []
+    for action, src, dest in suggestions:
+        if action == "COPY":
+            copies.append((src, dest))
+        else:
+            console.print(
+                f"  [bold orange_red1]⚠️ WARNING: Unknown action '{action}' for '{src}'. Skipping.[/]"
+            )
+
     try:
-        # Use a rich progress bar while iterating through operations
-        for action, src, dest in track(
-            suggestions, description="[bold green]Syncing files...[/]"
-        ):
-            if action == "COPY":
-                try:
-                    dest_dir = os.path.dirname(dest)
-                    os.makedirs(dest_dir, exist_ok=True)
-                    shutil.copy2(src, dest)  # copy2 preserves metadata
-                except Exception as e:
-                    console.print(f"  [bold red]❌ ERROR copying '{src}': {e}[/]")
-            else:
-                console.print(
-                    f"  [bold orange_red1]⚠️ WARNING: Unknown action '{action}' for '{src}'. Skipping.[/]"
-                )
+        # Create each destination directory once, before any copy starts
+        for dest_dir in {os.path.dirname(dest) for _, dest in copies}:
+            try:
+                os.makedirs(dest_dir, exist_ok=True)
+            except Exception as e:
+                console.print(f"  [bold red]❌ ERROR creating '{dest_dir}': {e}[/]")
+
+        if copies:
+            # Copies are I/O bound and release the GIL, so running several at
+            # once keeps the disk or network busy
+            with ThreadPoolExecutor(max_workers=min(32, len(copies))) as executor:
+                futures = {
+                    executor.submit(copy_file, src, dest): src  # Preserves metadata
+                    for src, dest in copies
+                }
+                # Use a rich progress bar that advances as copies complete
+                for future in track(
+                    as_completed(futures),
+                    total=len(futures),
+                    description="[bold green]Syncing files...[/]",
+                ):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        console.print(
+                            f"  [bold red]❌ ERROR copying '{futures[future]}': {e}[/]"
+                        )
         console.print(
             "\n[bold green]✅ Sync execution finished successfully![/bold green]"
         )
@@ -188,6 +315,11 @@ def main():
         action="store_true",
         help="Execute sync without the confirmation prompt. Use with caution.",
     )
+    parser.add_argument(
+        "--serial-scan",
+        action="store_true",
+        help="Scan the two directories one after the other instead of concurrently.\nUseful when both live on the same spinning disk.",
+    )
 
     args = parser.parse_args()
 
@@ -200,7 +332,9 @@ def main():
         exit(1)
 
     # --- Run Comparison ---
-    sync_suggestions = compare_and_suggest_sync(args.dir1, args.dir2)
+    sync_suggestions = compare_and_suggest_sync(
+        args.dir1, args.dir2, serial_scan=args.serial_scan
+    )
 
     # --- Handle Execution ---
     if not sync_suggestions:
@@ -9,63 +9,326 @@ the modification timestamp.
 This is useful for those who prefer to track Jupyter Notebooks in .py files.
 
 Usage:
-    python sync_jupyter.py [DIRECTORY] [-y/--yes]
+    python sync_jupyter.py [DIRECTORY] [-y/--yes] [-r/--recursive] [-j/--jobs N]
 
 Arguments:
     DIRECTORY: The directory to scan for files. Defaults to the current directory.
     -y, --yes: Skip the confirmation prompt and sync files directly.
+    -r, --recursive: Also scan all non-hidden subdirectories.
+    -j, --jobs: Maximum number of concurrent jupytext processes. Defaults to the number of CPUs.
 
 Author: Yunho Cho
 """
 
 import argparse
+import functools
+import io
+import shutil
 import subprocess
 import sys
+import time
 import os
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from datetime import datetime
 
+# Only the console is imported up front. The table and prompt modules are
+# imported where they are used, so runs with nothing to sync start faster.
 try:
     from rich.console import Console
-    from rich.table import Table
-    from rich.prompt import Confirm
 except ImportError:
     print("Error: The 'rich' library is required. Please install it using 'pip install rich'", file=sys.stderr)
     sys.exit(1)
 
-def find_and_compare_files(directory: Path):
+# Suffixes of the files that make up a pair
+PAIR_SUFFIXES = ('.py', '.ipynb')
+
+# Pairs whose modification times differ by at most this many seconds are
+# considered in sync
+MTIME_TOLERANCE = 1.0
+
+# Number of files passed to a single jupytext invocation, which keeps the
+# command line well below OS length limits
+JUPYTEXT_BATCH_SIZE = 200
+
+def scan_directory(directory: str, recursive: bool = False):
+    """
+    Lists a single directory.
+
+    Returns a list of (stem_path, kind, DirEntry) tuples for its .py and .ipynb
+    files, where stem_path is the file's path without its suffix, and a list of
+    subdirectories to descend into when `recursive` is set (hidden directories,
+    such as .git or .ipynb_checkpoints, and symlinks are skipped).
+    """
+    files, subdirs = [], []
+    # A single scandir pass covers both suffixes. Entries are classified by
+    # name only; files are stat-ed later, and only if they are part of a pair.
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            # Most entries match neither suffix; reject them with a single check
+            if name.endswith(PAIR_SUFFIXES) and entry.is_file():
+                if name.endswith('.py'):
+                    files.append((entry.path[:-3], 'py', entry))
+                else:
+                    files.append((entry.path[:-6], 'ipynb', entry))
+            elif recursive and not name.startswith('.') and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    return files, subdirs
+
+def scan_subdirectory(directory: str):
+    """Like scan_directory, but skips unreadable directories, as os.walk does."""
+    try:
+        return scan_directory(directory, recursive=True)
+    except OSError:
+        return [], []
+
+def walk_files(directory: Path, recursive: bool = False):
+    """
+    Yields the file lists of `directory` and, if `recursive` is set, of all its
+    subdirectories. Subdirectories are scanned on a thread pool, each scan
+    submitting its own subdirectories as soon as it finishes, so that many
+    directory reads are in flight at once.
+    """
+    files, subdirs = scan_directory(directory, recursive)
+    yield files
+    if not subdirs:
+        return
+
+    # Directory scans are I/O bound, so use more threads than cores
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        pending = {executor.submit(scan_subdirectory, d) for d in subdirs}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                pending.update(executor.submit(scan_subdirectory, d) for d in subdirs)
+                yield files
+
+def find_and_compare_files(directory: Path, recursive: bool = False):
     """Finds and compares modification times of .py and .ipynb file pairs."""
-    file_pairs = {}
-    # Group files by their base name (e.g., 'notebook' for 'notebook.py' and 'notebook.ipynb')
-    for f in directory.glob('*.py'):
-        file_pairs.setdefault(f.stem, {})['py'] = f
-    for f in directory.glob('*.ipynb'):
-        file_pairs.setdefault(f.stem, {})['ipynb'] = f
+    file_pairs = defaultdict(dict)
+    # Group files by their base name (e.g., 'notebook' for 'notebook.py' and 'notebook.ipynb').
+    # The base name is kept with its directory, so pairs never span directories.
+    for files in walk_files(directory, recursive):
+        for stem_path, kind, entry in files:
+            file_pairs[stem_path][kind] = entry
 
     operations = []
-    for base, files in file_pairs.items():
-        if 'py' in files and 'ipynb' in files:
-            py_file = files['py']
-            ipynb_file = files['ipynb']
-
-            py_mtime = py_file.stat().st_mtime
-            ipynb_mtime = ipynb_file.stat().st_mtime
-
-            source, dest = None, None
-            if py_mtime > ipynb_mtime:
-                source, dest = py_file, ipynb_file
-            elif ipynb_mtime > py_mtime:
-                source, dest = ipynb_file, py_file
-
-            if source and dest:
-                operations.append({
-                    "source": source,
-                    "dest": dest,
-                    "source_mtime": datetime.fromtimestamp(source.stat().st_mtime),
-                    "dest_mtime": datetime.fromtimestamp(dest.stat().st_mtime),
-                })
+    for files in file_pairs.values():
+        # Each stem holds at most one 'py' and one 'ipynb' entry, so two entries form a pair
+        if len(files) == 2:
+            py_entry, ipynb_entry = files['py'], files['ipynb']
+
+            # DirEntry caches its stat result, so each file is stat-ed once
+            py_stat = py_entry.stat()
+            ipynb_stat = ipynb_entry.stat()
+
+            # Skip pairs whose mtimes only differ by filesystem timestamp
+            # granularity (e.g. FAT's 2-second resolution), so unchanged
+            # pairs never reach jupytext
+            if abs(py_stat.st_mtime - ipynb_stat.st_mtime) <= MTIME_TOLERANCE:
+                continue
+
+            if py_stat.st_mtime > ipynb_stat.st_mtime:
+                source, source_stat, dest, dest_stat = py_entry, py_stat, ipynb_entry, ipynb_stat
+            else:
+                source, source_stat, dest, dest_stat = ipynb_entry, ipynb_stat, py_entry, py_stat
+
+            operations.append({
+                "source": Path(source.path),
+                "dest": Path(dest.path),
+                "source_mtime": source_stat.st_mtime,
+                "dest_mtime": dest_stat.st_mtime,
+            })
     return operations
 
+def format_time(timestamp: float) -> str:
+    """Formats a timestamp for display, without building a datetime object."""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+class SyncError(Exception):
+    """Raised when jupytext fails to sync a pair."""
+
+    def __init__(self, source: Path, stderr: str):
+        super().__init__(f"jupytext failed to sync {source}")
+        self.source = source
+        self.stderr = stderr
+
+@functools.cache
+def load_jupytext_cli():
+    """
+    Returns jupytext's command-line entry point if jupytext is importable in
+    this interpreter, or None. It is imported on first use only, since the
+    import is only worth paying when there is something to sync.
+    """
+    try:
+        from jupytext.cli import jupytext
+    except ImportError:
+        return None
+    return jupytext
+
+@functools.cache
+def find_jupytext_executable() -> str | None:
+    """Resolves the `jupytext` command on PATH once, rather than on every spawn."""
+    return shutil.which('jupytext')
+
+def run_jupytext_sync(sources: list[Path]):
+    """
+    Runs `jupytext --sync` on the given files.
+
+    jupytext is called in-process when it can be imported, which avoids
+    starting a new interpreter and re-importing jupytext for every call.
+    Otherwise the `jupytext` command is run in a subprocess. Either way a
+    failure raises subprocess.CalledProcessError carrying jupytext's stderr.
+    """
+    # Use jupytext to sync. We can point to either file in each pair.
+    # Jupytext will find the other and sync the older one.
+    args = ['--sync', *map(str, sources)]
+
+    jupytext_cli = load_jupytext_cli()
+    if jupytext_cli is None:
+        subprocess.run(
+            [find_jupytext_executable(), *args],
+            check=True,
+            stdout=subprocess.DEVNULL, # jupytext's progress output is never shown
+            stderr=subprocess.PIPE, # Kept to report errors
+            text=True
+        )
+        return
+
+    # To hide jupytext output unless there's an error
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            returncode = jupytext_cli(args)
+        except SystemExit as e:
+            # The CLI exits through argparse on invalid arguments. As with
+            # sys.exit(), None means success and any non-int code is a failure.
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                returncode = 1
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=stderr)
+            returncode = 1
+    if returncode:
+        raise subprocess.CalledProcessError(
+            returncode, ['jupytext', *args], stdout.getvalue(), stderr.getvalue()
+        )
+
+def copy_times(op: dict):
+    """Sets the access and modification times of the destination file to match the source file."""
+    source_stats = os.stat(op['source'])
+    # This will make the destination file's atime and mtime identical to the source file's,
+    # down to the nanosecond (float seconds would lose sub-microsecond precision)
+    os.utime(op['dest'], ns=(source_stats.st_atime_ns, source_stats.st_mtime_ns))
+
+def sync_pair(op: dict):
+    """Syncs one pair with its own jupytext run and copies the timestamps."""
+    try:
+        run_jupytext_sync([op['source']])
+    except subprocess.CalledProcessError as e:
+        raise SyncError(op['source'], e.stderr) from e
+    copy_times(op)
+
+def sync_each(operations: list[dict], status, jobs: int):
+    """Syncs the pairs with one jupytext run each, keeping up to `jobs` processes running at once."""
+    if load_jupytext_cli() is not None:
+        # In-process runs are kept serial, since they redirect the global sys.stdout
+        for op in operations:
+            status.update(f"[bold green]Syncing[/] [cyan]{op['source'].name}[/] -> [cyan]{op['dest'].name}[/]")
+            sync_pair(op)
+        return
+
+    # Processes are launched ahead of being waited on, so their startup
+    # (interpreter and jupytext import) overlaps. The window bounds how many
+    # run at once, and they are waited on in launch order.
+    running = deque()
+    synced = 0
+
+    def finish_oldest():
+        nonlocal synced
+        op, proc = running.popleft()
+        _, stderr = proc.communicate()
+        if proc.returncode:
+            raise SyncError(op['source'], stderr)
+        copy_times(op)
+        synced += 1
+        status.update(f"[bold green]Synced[/] {synced}/{len(operations)} pairs")
+
+    try:
+        for op in operations:
+            if len(running) >= jobs:
+                finish_oldest()
+            running.append((op, subprocess.Popen(
+                [find_jupytext_executable(), '--sync', str(op['source'])],
+                stdout=subprocess.DEVNULL, # jupytext's progress output is never shown
+                stderr=subprocess.PIPE, # Kept to report errors
+                text=True
+            )))
+        while running:
+            finish_oldest()
+    finally:
+        # After an error, let the processes already started finish writing
+        # rather than killing them halfway through a notebook
+        for _, proc in running:
+            proc.communicate()
+
+def sync_all(operations: list[dict], status, jobs: int):
+    """
+    Syncs all pairs, paying jupytext's startup cost once per batch rather than
+    once per pair. If a batch fails, its pairs are synced one by one to find
+    and report the failing pair (re-syncing an already synced pair is a no-op).
+    """
+    for start in range(0, len(operations), JUPYTEXT_BATCH_SIZE):
+        batch = operations[start:start + JUPYTEXT_BATCH_SIZE]
+        status.update(f"[bold green]Syncing[/] {len(batch)} pairs with jupytext...")
+        try:
+            run_jupytext_sync([op['source'] for op in batch])
+        except subprocess.CalledProcessError:
+            # jupytext stops at the first file it fails on
+            sync_each(batch, status, jobs)
+            continue
+        for op in batch:
+            copy_times(op)
+
+def print_plan(console: Console, operations: list[dict], target_dir: Path):
+    """Prints the planned operations as a table."""
+    from rich.table import Table
+
+    table = Table(
+        title=f"[bold yellow]File Synchronization Plan for '{target_dir.name}' (Dry Run)[/]",
+        title_style="yellow",
+        header_style="bold cyan"
+    )
+    table.add_column("Action", style="red", justify="center")
+    table.add_column("Newer File (Source)", style="green")
+    table.add_column("Last Modified", style="dim")
+    table.add_column("Older File (Destination)", style="red")
+    table.add_column("Last Modified", style="dim")
+
+    for op in operations:
+        table.add_row(
+            "OVERWRITE",
+            str(op['source'].relative_to(target_dir)),
+            format_time(op['source_mtime']),
+            str(op['dest'].relative_to(target_dir)),
+            format_time(op['dest_mtime']),
+        )
+
+    console.print(table)
+    console.print()
+
+def confirm(prompt: str) -> bool:
+    """Asks the user for confirmation."""
+    from rich.prompt import Confirm
+
+    return Confirm.ask(prompt)
+
 def main():
     """Main function to run the sync script."""
     parser = argparse.ArgumentParser(
@@ -82,11 +345,27 @@ def main():
         action="store_true",
         help="Skip the confirmation prompt and sync files directly."
     )
+    parser.add_argument(
+        "-r", "--recursive",
+        action="store_true",
+        help="Also scan all non-hidden subdirectories for file pairs."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 4,
+        help="Maximum number of jupytext processes run at once when pairs are synced individually. Defaults to the number of CPUs."
+    )
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     console = Console()
 
-    target_dir = Path(args.directory).resolve()
+    # Only an absolute path is needed for scanning and display; unlike
+    # resolve(), abspath normalizes the path without any syscalls
+    target_dir = Path(os.path.abspath(args.directory))
 
     if not target_dir.is_dir():
         console.print(f"[bold red]Error:[/bold red] The specified path '{args.directory}' is not a valid directory.")
@@ -94,66 +373,42 @@ def main():
 
     console.print(f"Scanning directory: [cyan]{target_dir}[/cyan]")
 
-    with console.status("[bold green]Scanning for files...[/]"):
-        operations = find_and_compare_files(target_dir)
+    try:
+        with console.status("[bold green]Scanning for files...[/]"):
+            operations = find_and_compare_files(target_dir, recursive=args.recursive)
+    except OSError as e:
+        # Unreadable subdirectories are skipped during the walk; this is the
+        # target directory itself (e.g. no read permission)
+        console.print(f"[bold red]Error:[/bold red] The specified directory '{args.directory}' could not be read ({e.strerror or e}).")
+        sys.exit(1)
 
     if not operations:
         console.print("[bold green]✓ All files are in sync. Nothing to do.[/]")
         return
 
-    # --- Dry Run Table ---
-    table = Table(
-        title=f"[bold yellow]File Synchronization Plan for '{target_dir.name}' (Dry Run)[/]",
-        title_style="yellow",
-        header_style="bold cyan"
-    )
-    table.add_column("Action", style="red", justify="center")
-    table.add_column("Newer File (Source)", style="green")
-    table.add_column("Last Modified", style="dim")
-    table.add_column("Older File (Destination)", style="red")
-    table.add_column("Last Modified", style="dim")
-
-    for op in operations:
-        table.add_row(
-            "OVERWRITE",
-            op['source'].name,
-            op['source_mtime'].strftime('%Y-%m-%d %H:%M:%S'),
-            op['dest'].name,
-            op['dest_mtime'].strftime('%Y-%m-%d %H:%M:%S'),
-        )
+    # Make sure jupytext is available before planning any changes
+    if load_jupytext_cli() is None and find_jupytext_executable() is None:
+        console.print("[bold red]Error: 'jupytext' command not found.[/bold red]")
+        console.print("Please install jupytext: [cyan]pip install jupytext[/cyan]")
+        sys.exit(1)
 
-    console.print(table)
-    console.print()
+    # --- Dry Run Table ---
+    if args.yes and not sys.stdout.isatty():
+        # Nobody reads the plan in a scripted run, so skip rendering the table
+        print(f"Syncing {len(operations)} pairs...")
+    else:
+        print_plan(console, operations, target_dir)
 
     # --- Confirmation and Execution ---
-    if args.yes or Confirm.ask("[bold]Do you want to apply these changes?[/]"):
+    if args.yes or confirm("[bold]Do you want to apply these changes?[/]"):
         console.print("\n[bold]Starting synchronization...[/]")
         with console.status("[bold green]Syncing files with jupytext...[/]") as status:
-            for op in operations:
-                source, dest = op['source'], op['dest']
-                status.update(f"[bold green]Syncing[/] [cyan]{source.name}[/] -> [cyan]{dest.name}[/]")
-                try:
-                    # Use jupytext to sync. We can point to either file in the pair.
-                    # Jupytext will find the other and sync the older one.
-                    subprocess.run(
-                        ['jupytext', '--sync', str(source)],
-                        check=True,
-                        capture_output=True, # To hide jupytext output unless there's an error
-                        text=True
-                    )
-
-                    # Set the access and modification times of the destination file to match the source file
-                    source_stats = source.stat()
-                    # This will make the destination file's atime and mtime identical to the source file's
-                    os.utime(dest, (source_stats.st_atime, source_stats.st_mtime))
-                except FileNotFoundError:
-                    console.print("[bold red]Error: 'jupytext' command not found.[/bold red]")
-                    console.print("Please install jupytext: [cyan]pip install jupytext[/cyan]")
-                    sys.exit(1)
-                except subprocess.CalledProcessError as e:
-                    console.print(f"[bold red]Error syncing {source.name}:[/bold red]")
-                    console.print(e.stderr)
-                    sys.exit(1)
+            try:
+                sync_all(operations, status, args.jobs)
+            except SyncError as e:
+                console.print(f"[bold red]Error syncing {e.source.name}:[/bold red]")
+                console.print(e.stderr)
+                sys.exit(1)
         console.print("[bold green]✓ Synchronization complete![/]")
     else:
         console.print("[bold red]✗ Operation cancelled.[/]")